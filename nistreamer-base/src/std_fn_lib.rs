@@ -60,8 +60,41 @@ pub struct Sine {
 }
 impl Calc<f64> for Sine {
     fn calc(&self, t_arr: &[f64], res_arr: &mut[f64]) {
+        let omega = 2.0*PI * self.freq;
         for (res, &t) in res_arr.iter_mut().zip(t_arr.iter()) {
-            *res = self.offs + self.amp * f64::sin(2.0*PI * self.freq * t + self.phase)
+            *res = self.offs + self.amp * f64::sin(omega * t + self.phase)
+        }
+    }
+}
+
+/// Sinusoidal ramp:
+///     t0 - ramp start time
+///     dur - ramp duration
+///     start - value at `t0`
+///     end - value at `t0 + dur`
+/// `SineRamp(t) = (start + end)/2 + (start - end)/2 * cos(Pi * (t - t0) / dur)`
+/// A half-period of cosine connecting the two points with zero derivative on both ends.
+/// Zero-duration ramp (`dur = 0`) is treated as an instant step - the function evaluates to `end` everywhere.
+#[std_fn_f64]
+pub struct SineRamp {
+    t0: f64,
+    dur: f64,
+    start: f64,
+    end: f64,
+}
+impl Calc<f64> for SineRamp {
+    fn calc(&self, t_arr: &[f64], res_arr: &mut[f64]) {
+        if self.dur == 0.0 {
+            // Avoid `Pi / 0 = inf` (and NaN at `t = t0`)
+            res_arr.fill(self.end);
+            return
+        }
+        let mid = 0.5 * (self.start + self.end);
+        let half_span = 0.5 * (self.start - self.end);
+        let k = PI / self.dur;
+        for (res, &t) in res_arr.iter_mut().zip(t_arr.iter()) {
+            // The argument is counted from `t0` so it stays within [0, Pi] over the ramp
+            *res = mid + half_span * f64::cos(k * (t - self.t0))
         }
     }
 }
@@ -211,3 +244,50 @@ impl Calc<bool> for ConstBool {
     }
 }
 // endregion
+
+#[cfg(test)]
+mod test {
+    use std::f64::consts::PI;
+    use crate::fn_lib_base::Calc;
+    use crate::std_fn_lib::{Sine, SineRamp};
+
+    fn calc_vec<F: Calc<f64>>(func: &F, t_arr: &[f64]) -> Vec<f64> {
+        let mut res_arr = vec![0.0; t_arr.len()];
+        func.calc(t_arr, &mut res_arr);
+        res_arr
+    }
+
+    #[test]
+    fn sine_ramp_matches_sine() {
+        // Large `t0` to check that counting the argument from `t0` does not change the waveform
+        let (t0, dur, start, end) = (1000.0, 1e-3, -2.0, 3.0);
+        let n_samps = 1001;
+        let t_arr: Vec<f64> = (0..n_samps)
+            .map(|i| t0 + dur * (i as f64) / ((n_samps - 1) as f64))
+            .collect();
+
+        // The former implementation of the ramp in terms of `Sine`
+        let sine = Sine::new(
+            (end - start) / 2.0,
+            1.0 / (2.0 * dur),
+            -2.0*PI * (t0 / (2.0 * dur) + 0.25),
+            (end + start) / 2.0,
+        );
+        let ramp = SineRamp::new(t0, dur, start, end);
+        let sine_vals = calc_vec(&sine, &t_arr);
+        let ramp_vals = calc_vec(&ramp, &t_arr);
+
+        for (&sine_val, &ramp_val) in sine_vals.iter().zip(ramp_vals.iter()) {
+            assert!((sine_val - ramp_val).abs() < 1e-8, "sine_val = {sine_val}, ramp_val = {ramp_val}");
+        }
+        assert!((ramp_vals[0] - start).abs() < 1e-12);
+        assert!((ramp_vals[n_samps - 1] - end).abs() < 1e-12);
+    }
+
+    #[test]
+    fn sine_ramp_zero_dur() {
+        let ramp = SineRamp::new(1.0, 0.0, -2.0, 3.0);
+        let vals = calc_vec(&ramp, &[0.5, 1.0, 1.5]);
+        assert_eq!(vals, vec![3.0, 3.0, 3.0]);
+    }
+}
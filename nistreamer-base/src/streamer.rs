@@ -136,10 +136,11 @@ pub trait BaseStreamer {
     }
 
     fn clear_edit_cache(&mut self) {
+        // Each device also clears its own compile cache as part of `clear_edit_cache()`,
+        // so a separate `self.clear_compile_cache()` pass over all devices is not needed
         for dev in self.devs_mut() {
             dev.tag_clear_edit_cache()
         };
-        self.clear_compile_cache();
     }
 
     fn validate_compile_cache(&self) -> Result<(), String> {
@@ -28,17 +28,28 @@ class BaseCardProxy:
         self._chans = dict()
 
     def __getitem__(self, item):
-        if item in self._chans:
+        try:
             return self._chans[item]
-        else:
-            raise KeyError(f'There is no channel "{item}"')
-
-    # # ToDo: implement to be able to use .keys(), .values(), and .items() to see all channels reserved
-    # def __len__(self):
-    #     pass
-    #
-    # def __iter__(self):
-    #     pass
+        except KeyError:
+            raise KeyError(f'There is no channel "{item}"') from None
+
+    def __len__(self):
+        return len(self._chans)
+
+    def __iter__(self):
+        return iter(self._chans)
+
+    def keys(self):
+        """Names of all channels added to this card."""
+        return self._chans.keys()
+
+    def values(self):
+        """Proxies of all channels added to this card."""
+        return self._chans.values()
+
+    def items(self):
+        """``(chan_name, chan_proxy)`` pairs for all channels added to this card."""
+        return self._chans.items()
 
     def __repr__(self):
         return (
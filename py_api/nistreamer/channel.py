@@ -8,12 +8,48 @@ from ._nistreamer import StreamerWrap as _StreamerWrap
 from ._nistreamer import StdFnLib
 from abc import ABC, abstractmethod
 from typing import Optional, Union
-import math
+from functools import lru_cache
+from numbers import Real
+import struct
+
+# `StdFnLib` holds no state (it is only a namespace for the function constructors),
+# so a single instance is shared by all channels
+_std_fn_lib = StdFnLib()
+# Function objects are immutable (the backend clones them when adding an instruction),
+# so the same instance can be reused for every instruction with the same parameters
+_const_true = _std_fn_lib.ConstBool(val=True)
+_const_false = _std_fn_lib.ConstBool(val=False)
+
+
+@lru_cache(maxsize=1024)
+def _const_f64_by_bits(val_bits: bytes):
+    val, = struct.unpack('d', val_bits)
+    return _std_fn_lib.ConstF64(val=val)
+
+
+def _const_f64(val):
+    # Cached `ConstF64` instances are keyed on the exact float bit pattern rather than on Python equality,
+    # so that `0.0`/`-0.0` get separate instances, NaN values hit the cache, and any value
+    # convertible to float (e.g. 0-d NumPy array) is accepted
+    return _const_f64_by_bits(struct.pack('d', float(val)))
+
+
+def _fixed_dur_specs(durs, n):
+    # Duration specs for a train of `n` fixed-duration pulses.
+    # If a single duration is given for the whole train, the same `dur_spec` tuple is shared by all pulses
+    if isinstance(durs, Real):
+        return [(durs, False)] * n
+    return [(dur, False) for dur in durs]
 
 
 class BaseChanProxy(ABC):
     """The base of channel proxy classes."""
 
+    # Proxies are created one per channel and have a fixed set of attributes,
+    # so `__slots__` are used instead of per-instance `__dict__`
+    __slots__ = ('_streamer', '_card_max_name', '_nickname', '_std_fn_lib',
+                 '_chan_name', '_dflt_val', '_rst_val')
+
     def __init__(self,
                  _streamer: _StreamerWrap,
                  _card_max_name: str,
@@ -22,7 +58,7 @@ class BaseChanProxy(ABC):
         self._streamer = _streamer
         self._card_max_name = _card_max_name
         self._nickname = nickname
-        self._std_fn_lib = StdFnLib()
+        self._std_fn_lib = _std_fn_lib
 
     def __repr__(self, card_info=False):
         return (
@@ -39,6 +75,7 @@ class BaseChanProxy(ABC):
         # One should call StreamerWrap method to get the name string instead of assembling it manually here.
         # Since StreamerWrap's methods for AO and DO cards are different,
         # each subclass has to re-implement this property to call the corresponding Rust method
+        # (the name never changes, so subclasses call it once in `__init__()` and cache the result)
         pass
 
     @property
@@ -179,7 +216,8 @@ class BaseChanProxy(ABC):
             nsamps: number of points
 
         Returns:
-            List of corresponding channel values
+            NumPy array of corresponding channel values
+            (``float64`` for analog and ``bool`` for digital channels)
 
         Raises:
             ValueError: if any parameters are invalid, if sequence is not fresh-compiled.
@@ -216,6 +254,9 @@ class BaseChanProxy(ABC):
 
 class AOChanProxy(BaseChanProxy):
     """Analog output channel proxy."""
+
+    __slots__ = ('chan_idx',)
+
     def __init__(self,
                  _streamer: _StreamerWrap,
                  _card_max_name: str,
@@ -229,28 +270,33 @@ class AOChanProxy(BaseChanProxy):
             nickname=nickname
         )
         self.chan_idx = chan_idx
-
-    @property
-    def chan_name(self) -> str:
-        return self._streamer.ao_chan_name(
+        # Name, default and reset values are fixed once the channel is added,
+        # so they are fetched from the backend only once and cached here
+        self._chan_name = self._streamer.ao_chan_name(
             dev_name=self._card_max_name,
             chan_idx=self.chan_idx
         )
-
-    @property
-    def dflt_val(self) -> float:
-        return self._streamer.ao_chan_dflt_val(
+        self._dflt_val = self._streamer.ao_chan_dflt_val(
             dev_name=self._card_max_name,
             chan_idx=self.chan_idx
         )
-
-    @property
-    def rst_val(self) -> float:
-        return self._streamer.ao_chan_rst_val(
+        self._rst_val = self._streamer.ao_chan_rst_val(
             dev_name=self._card_max_name,
             chan_idx=self.chan_idx
         )
 
+    @property
+    def chan_name(self) -> str:
+        return self._chan_name
+
+    @property
+    def dflt_val(self) -> float:
+        return self._dflt_val
+
+    @property
+    def rst_val(self) -> float:
+        return self._rst_val
+
     def calc_signal(self, start_time=None, end_time=None, nsamps=1000):
         return self._streamer.ao_chan_calc_nsamps(
             dev_name=self._card_max_name,
@@ -268,13 +314,13 @@ class AOChanProxy(BaseChanProxy):
         )
 
     def _add_instr(self, func, t, dur_spec):
-        self._streamer.ao_chan_add_instr(
-            dev_name=self._card_max_name,
-            chan_idx=self.chan_idx,
-            func=func,
-            t=t,
-            dur_spec=dur_spec
-        )
+        # Positional arguments (the order is `dev_name, chan_idx, func, t, dur_spec`)
+        # to avoid keyword parsing overhead on this hot path
+        self._streamer.ao_chan_add_instr(self._card_max_name, self.chan_idx, func, t, dur_spec)
+
+    def _add_instrs(self, funcs, ts, dur_specs):
+        # Batch version of `_add_instr` - all instructions are passed to the backend in a single call
+        self._streamer.ao_chan_add_instrs(self._card_max_name, self.chan_idx, funcs, ts, dur_specs)
 
     # region Convenience methods to access the most common StdFnLib functions
     def const(self, t: float, dur: float, val: float) -> float:
@@ -297,12 +343,35 @@ class AOChanProxy(BaseChanProxy):
             :meth:`go_const` if you want to set and keep the constant value instead.
         """
         return self.add_instr(
-            func=self._std_fn_lib.ConstF64(val=val),
+            func=_const_f64(val=val),
             t=t,
             dur=dur,
             keep_val=False
         )
     
+    def const_train(self, ts, durs, vals):
+        """Train of constant-value pulses with fixed durations.
+
+        Equivalent to calling :meth:`const` for each ``(t, dur, val)`` triple,
+        but all pulses are passed to the backend in a single call which is much
+        faster for long trains.
+
+        Args:
+            ts: sequence (list or NumPy array) of pulse start times
+            durs: sequence of pulse durations or a single duration for all pulses
+            vals: sequence of pulse values
+
+        Raises:
+            ValueError: if sequence lengths do not match or if some pulse collides
+                with an existing instruction. Pulses preceding the failed one
+                remain added.
+        """
+        self._add_instrs(
+            funcs=[_const_f64(val=val) for val in vals],
+            ts=ts,
+            dur_specs=_fixed_dur_specs(durs, len(ts))
+        )
+
     def go_const(self, t: float, val: float):
         """Set a constant value ``val`` at time ``t`` and keep it until further instructions.
 
@@ -310,7 +379,7 @@ class AOChanProxy(BaseChanProxy):
         interval until the next instruction start or global sequence end.
         """
         self.add_gothis_instr(
-            func=self._std_fn_lib.ConstF64(val=val),
+            func=_const_f64(val=val),
             t=t
         )
 
@@ -350,6 +419,44 @@ class AOChanProxy(BaseChanProxy):
             keep_val=keep_val
         )
     
+    def sine_batch(self,
+                   ts,
+                   durs,
+                   amps,
+                   freqs,
+                   phases=None,
+                   offs=None,
+                   keep_val: Optional[bool] = False):
+        """Batch of sinusoidal pulses with fixed durations.
+
+        Equivalent to calling :meth:`sine` for each set of parameters,
+        but all pulses are passed to the backend in a single call which is much
+        faster for many pulses.
+
+        Args:
+            ts: sequence (list or NumPy array) of pulse start times
+            durs: sequence of pulse durations
+            amps: sequence of amplitudes (Volts)
+            freqs: sequence of linear frequencies (Hz, 1/period)
+            phases: sequence of absolute phases (radians). Zero for all pulses if ``None``
+            offs: sequence of constant offsets (Volts). Zero for all pulses if ``None``
+            keep_val: if ``True``, the last value will be kept after each pulse,
+                otherwise channel goes to default value. The same for all pulses.
+
+        Raises:
+            ValueError: if sequence lengths do not match or if some pulse collides
+                with an existing instruction. Pulses preceding the failed one
+                remain added.
+        """
+        if phases is None:
+            phases = [0.0] * len(ts)
+        if offs is None:
+            offs = [0.0] * len(ts)
+        self._streamer.ao_chan_add_sines(
+            self._card_max_name, self.chan_idx,
+            ts, durs, amps, freqs, phases, offs, keep_val
+        )
+
     def go_sine(self,
                 t: float,
                 amp: float,
@@ -426,15 +533,10 @@ class AOChanProxy(BaseChanProxy):
 
         Raises:
             ValueError: if this instruction collides with an existing one
+                or if ``dur`` is shorter than one sample clock period
         """
-        amp = (end_val - start_val) / 2
-        offs = (end_val + start_val) / 2
-        period = 2 * dur
-        freq = 1 / period
-        phase = -2*math.pi * (t/period + 1/4)
-
         return self.add_instr(
-            func=self._std_fn_lib.Sine(amp=amp, freq=freq, phase=phase, offs=offs),
+            func=self._std_fn_lib.SineRamp(t0=t, dur=dur, start=start_val, end=end_val),
             t=t,
             dur=dur,
             keep_val=keep_val
@@ -444,6 +546,9 @@ class AOChanProxy(BaseChanProxy):
 
 class DOChanProxy(BaseChanProxy):
     """Digital output channel proxy (an individual digital line)."""
+
+    __slots__ = ('port', 'line')
+
     def __init__(self,
                  _streamer: _StreamerWrap,
                  _card_max_name: str,
@@ -459,31 +564,36 @@ class DOChanProxy(BaseChanProxy):
         )
         self.port = port_idx
         self.line = line_idx
-
-    @property
-    def chan_name(self) -> str:
-        return self._streamer.do_chan_name(
+        # Name, default and reset values are fixed once the channel is added,
+        # so they are fetched from the backend only once and cached here
+        self._chan_name = self._streamer.do_chan_name(
             dev_name=self._card_max_name,
             port=self.port,
             line=self.line
         )
-
-    @property
-    def dflt_val(self) -> bool:
-        return self._streamer.do_chan_dflt_val(
+        self._dflt_val = self._streamer.do_chan_dflt_val(
             dev_name=self._card_max_name,
             port=self.port,
             line=self.line
         )
-
-    @property
-    def rst_val(self) -> bool:
-        return self._streamer.do_chan_rst_val(
+        self._rst_val = self._streamer.do_chan_rst_val(
             dev_name=self._card_max_name,
             port=self.port,
             line=self.line
         )
 
+    @property
+    def chan_name(self) -> str:
+        return self._chan_name
+
+    @property
+    def dflt_val(self) -> bool:
+        return self._dflt_val
+
+    @property
+    def rst_val(self) -> bool:
+        return self._rst_val
+
     @property
     def const_fns_only(self) -> bool:
         """Shows if the host card has the "constant functions only" mode enabled.
@@ -522,14 +632,13 @@ class DOChanProxy(BaseChanProxy):
     def _unchecked_add_instr(self, func, t, dur_spec):
         # The actual call to `StreamerWrap.add_instr`.
         # This function is separate from `_add_instr` to implement `const_fns_only` mode checking.
-        self._streamer.do_chan_add_instr(
-            dev_name=self._card_max_name,
-            port=self.port,
-            line=self.line,
-            func=func,
-            t=t,
-            dur_spec=dur_spec
-        )
+        # Positional arguments (the order is `dev_name, port, line, func, t, dur_spec`)
+        # to avoid keyword parsing overhead on this hot path
+        self._streamer.do_chan_add_instr(self._card_max_name, self.port, self.line, func, t, dur_spec)
+
+    def _unchecked_add_instrs(self, funcs, ts, dur_specs):
+        # Batch version of `_unchecked_add_instr` - all instructions are passed to the backend in a single call
+        self._streamer.do_chan_add_instrs(self._card_max_name, self.port, self.line, funcs, ts, dur_specs)
 
     def _add_instr(self, func, t, dur_spec):
         # This function use is rejected whenever `const_fns_only` is `True`
@@ -551,7 +660,7 @@ class DOChanProxy(BaseChanProxy):
         # This is one of the four possible constant-valued boolean instructions and can be added
         # even if `const_fns_only = True`, so using `unchecked_add` directly:
         self._unchecked_add_instr(
-            func=self._std_fn_lib.ConstBool(val=True),
+            func=_const_true,
             t=t,
             dur_spec=None
         )
@@ -561,11 +670,43 @@ class DOChanProxy(BaseChanProxy):
         # This is one of the four possible constant-valued boolean instructions and can be added
         # even if `const_fns_only = True`, so using `unchecked_add` directly:
         self._unchecked_add_instr(
-            func=self._std_fn_lib.ConstBool(val=False),
+            func=_const_false,
             t=t,
             dur_spec=None
         )
 
+    def go_high_batch(self, ts):
+        """Batch version of :meth:`go_high` - sets the logical high at each time from ``ts``.
+
+        All instructions are passed to the backend in a single call.
+
+        Args:
+            ts: sequence (list or NumPy array) of times
+        """
+        # Constant-valued boolean instructions are allowed even if `const_fns_only = True`,
+        # so using `unchecked_add` directly:
+        self._unchecked_add_instrs(
+            funcs=[_const_true] * len(ts),
+            ts=ts,
+            dur_specs=[None] * len(ts)
+        )
+
+    def go_low_batch(self, ts):
+        """Batch version of :meth:`go_low` - sets the logical low at each time from ``ts``.
+
+        All instructions are passed to the backend in a single call.
+
+        Args:
+            ts: sequence (list or NumPy array) of times
+        """
+        # Constant-valued boolean instructions are allowed even if `const_fns_only = True`,
+        # so using `unchecked_add` directly:
+        self._unchecked_add_instrs(
+            funcs=[_const_false] * len(ts),
+            ts=ts,
+            dur_specs=[None] * len(ts)
+        )
+
     def high(self, t: float, dur: float) -> float:
         """Logical-high pulse from time ``t`` to ``t + dur``.
 
@@ -583,7 +724,7 @@ class DOChanProxy(BaseChanProxy):
         # This is one of the four possible constant-valued boolean instructions and can be added
         # even if `const_fns_only = True`, so using `unchecked_add` directly:
         self._unchecked_add_instr(
-            func=self._std_fn_lib.ConstBool(val=True),
+            func=_const_true,
             t=t,
             dur_spec=(dur, False)
         )
@@ -606,9 +747,33 @@ class DOChanProxy(BaseChanProxy):
         # This is one of the four possible constant-valued boolean instructions and can be added
         # even if `const_fns_only = True`, so using `unchecked_add` directly:
         self._unchecked_add_instr(
-            func=self._std_fn_lib.ConstBool(val=False),
+            func=_const_false,
             t=t,
             dur_spec=(dur, False)
         )
         return dur
+
+    def pulse_train(self, ts, durs):
+        """Train of logical-high pulses.
+
+        Equivalent to calling :meth:`high` for each ``(t, dur)`` pair,
+        but all pulses are passed to the backend in a single call which is much
+        faster for long trains.
+
+        Args:
+            ts: sequence (list or NumPy array) of pulse start times
+            durs: sequence of pulse durations or a single duration for all pulses
+
+        Raises:
+            ValueError: if sequence lengths do not match or if some pulse collides
+                with an existing instruction. Pulses preceding the failed one
+                remain added.
+        """
+        # Constant-valued boolean instructions are allowed even if `const_fns_only = True`,
+        # so using `unchecked_add` directly:
+        self._unchecked_add_instrs(
+            funcs=[_const_true] * len(ts),
+            ts=ts,
+            dur_specs=_fixed_dur_specs(durs, len(ts))
+        )
     # endregion
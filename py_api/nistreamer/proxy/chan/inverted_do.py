@@ -2,6 +2,8 @@ from nistreamer.channel import DOChanProxy
 
 
 class InvertedDOChan(DOChanProxy):
+    __slots__ = ()
+
     @property
     def dflt_val(self):
         return 'Off' if super().dflt_val else 'On'
@@ -6,26 +6,45 @@ for stream control in ``with`` context.
 
 from ._nistreamer import StreamerWrap as _StreamerWrap
 from .card import BaseCardProxy, AOCardProxy, DOCardProxy
-from typing import Optional, Literal, Union, Tuple, Type
+from typing import Optional, Union, Tuple, Type
+from concurrent.futures import ThreadPoolExecutor
+import os
 
 
 class NIStreamer:
     """Represents the whole streamer
+
+    Notes:
+        :meth:`compile`, stream initialization and :meth:`close_stream` release the GIL,
+        so other Python threads keep running while they work. But the streamer (including
+        its card and channel proxies) must not be used from other threads until these calls
+        return - any such call fails with ``RuntimeError: Already mutably borrowed``.
+
+        Signal calculation (channel ``calc_signal()`` and :meth:`calc_all_signals`) also releases
+        the GIL. Other threads may read from the streamer meanwhile, but must not edit it
+        (add instructions, clear edit cache, compile, etc.) until the calculation returns -
+        any such call fails with ``RuntimeError: Already borrowed``.
+
+        :meth:`StreamHandle.request_stop` and :meth:`StreamHandle.reps_written_count` can be
+        called from other threads while the stream is running, including during
+        :meth:`StreamHandle.wait_until_finished` and :meth:`run`.
     """
 
+    __slots__ = ('_streamer', '_ao_cards', '_do_cards', '_cards')
+
     def __init__(self):
         """Creates a new empty instance."""
         self._streamer = _StreamerWrap()
         self._ao_cards = dict()
         self._do_cards = dict()
+        # All cards in a single dict for lookup by name
+        self._cards = dict()
 
     def __getitem__(self, item):
-        if item in self._ao_cards.keys():
-            return self._ao_cards[item]
-        elif item in self._do_cards.keys():
-            return self._do_cards[item]
-        else:
-            raise KeyError(f'There is no card with max_name "{item}" registered')
+        try:
+            return self._cards[item]
+        except KeyError:
+            raise KeyError(f'There is no card with max_name "{item}" registered') from None
 
     def __repr__(self):
         return (
@@ -40,36 +59,21 @@ class NIStreamer:
             f'\t     Starts-last card: {self.starts_last}'
         )
 
-    def _add_card(self,
-                  card_type: Literal['AO', 'DO'],
-                  max_name: str,
-                  samp_rate: float,
-                  proxy_class: Type[BaseCardProxy],
-                  nickname: Optional[str] = None) -> BaseCardProxy:
-        """Base for ``add_card`` methods."""
-
-        if card_type == 'AO':
-            streamer_method = _StreamerWrap.add_ao_dev
-            target_dict = self._ao_cards
-        elif card_type == 'DO':
-            streamer_method = _StreamerWrap.add_do_dev
-            target_dict = self._do_cards
-        else:
-            raise ValueError(f'Invalid card type "{card_type}". Valid type strings are "AO" and "DO"')
+    def _add_card_proxy(self,
+                        target_dict: dict,
+                        max_name: str,
+                        proxy_class: Type[BaseCardProxy],
+                        nickname: Optional[str] = None) -> BaseCardProxy:
+        """Base for ``add_card`` methods - creates and registers the proxy
+        once the card was added to the backend."""
 
-        # Call to NIStreamer struct in the compiled Rust backend
-        streamer_method(
-            self._streamer,
-            name=max_name,
-            samp_rate=samp_rate
-        )
-        # Proxy object
         proxy = proxy_class(
             _streamer=self._streamer,
             max_name=max_name,
             nickname=nickname
         )
         target_dict[max_name] = proxy
+        self._cards[max_name] = proxy
         return proxy
 
     def add_ao_card(self,
@@ -91,10 +95,11 @@ class NIStreamer:
         Raises:
             KeyError: if a card with the same name already exists.
         """
-        return self._add_card(
-            card_type='AO',
+        # Call to NIStreamer struct in the compiled Rust backend
+        self._streamer.add_ao_dev(name=max_name, samp_rate=samp_rate)
+        return self._add_card_proxy(
+            target_dict=self._ao_cards,
             max_name=max_name,
-            samp_rate=samp_rate,
             nickname=nickname,
             proxy_class=proxy_class
         )
@@ -118,10 +123,11 @@ class NIStreamer:
         Raises:
             KeyError: if a card with the same name already exists.
         """
-        return self._add_card(
-            card_type='DO',
+        # Call to NIStreamer struct in the compiled Rust backend
+        self._streamer.add_do_dev(name=max_name, samp_rate=samp_rate)
+        return self._add_card_proxy(
+            target_dict=self._do_cards,
             max_name=max_name,
-            samp_rate=samp_rate,
             nickname=nickname,
             proxy_class=proxy_class
         )
@@ -241,6 +247,9 @@ class NIStreamer:
 
             - Constant values after finite-duration instructions.
             - Continued waveforms after "go-this" instructions.
+
+            If there were no edits since the last successful compilation with the same
+            ``stop_time``, the existing compile cache is reused and this call returns immediately.
         """
         return self._streamer.compile(stop_time=stop_time)
 
@@ -256,6 +265,42 @@ class NIStreamer:
         """
         self._streamer.validate_compile_cache()
 
+    def calc_all_signals(self,
+                         start_time: Union[float, None] = None,
+                         end_time: Union[float, None] = None,
+                         nsamps: Optional[int] = 1000) -> dict:
+        """Computes signals of all channels which got instructions.
+
+        Equivalent to calling :meth:`~nistreamer.channel.BaseChanProxy.calc_signal`
+        with the same arguments for every such channel, but the channels are computed
+        in parallel (the backend releases the GIL while computing the samples).
+
+        Args:
+            start_time: interval start. If ``None``, zero time is used
+            end_time: interval end. If ``None``, sequence end is used
+            nsamps: number of points
+
+        Returns:
+            Dictionary mapping ``'card_max_name/chan_name'`` to the NumPy array of channel values.
+            Channel nicknames are not used as keys since they are not guaranteed to be unique across cards.
+
+        Raises:
+            ValueError: if any parameters are invalid, if sequence is not fresh-compiled.
+        """
+        self.validate_compile_cache()
+        chans = {
+            f'{card.max_name}/{chan_name}': chan
+            for card in self._cards.values()
+            for chan_name, chan in card.items()
+            if chan.last_instr_end_time() is not None
+        }
+        with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+            futures = {
+                key: executor.submit(chan.calc_signal, start_time=start_time, end_time=end_time, nsamps=nsamps)
+                for key, chan in chans.items()
+            }
+            return {key: future.result() for key, future in futures.items()}
+
     def init_stream(self):
         """Context-based stream initialization.
 
@@ -307,10 +352,9 @@ class NIStreamer:
             :meth:`init_stream` and :class:`StreamHandle`
             for full stream control.
         """
-        with self.init_stream() as stream_handle:
-            for _ in range(nreps):
-                stream_handle.launch(instream_reps=1)
-                stream_handle.wait_until_finished()
+        with self.init_stream():
+            # The launch-and-wait loop over repetitions runs in the backend
+            self._streamer.run_reps(nreps=nreps)
 
     def close_stream(self):
         """Closes the stream.
@@ -577,9 +577,9 @@ impl AODev {
         Ok(())
     }
 
-    pub fn borrow_chan(&self, name: String) -> Result<&AOChan, String> {
-        if self.chans.keys().contains(&name) {
-            Ok(self.chans.get(&name).unwrap())
+    pub fn borrow_chan(&self, name: &str) -> Result<&AOChan, String> {
+        if self.chans.contains_key(name) {
+            Ok(self.chans.get(name).unwrap())
         } else {
             Err(format!(
                 "AO device {} does not have a channel {name} registered. Registered channels are: {:?}",
@@ -588,9 +588,9 @@ impl AODev {
         }
     }
 
-    pub fn borrow_chan_mut(&mut self, name: String) -> Result<&mut AOChan, String> {
-        if self.chans.keys().contains(&name) {
-            Ok(self.chans.get_mut(&name).unwrap())
+    pub fn borrow_chan_mut(&mut self, name: &str) -> Result<&mut AOChan, String> {
+        if self.chans.contains_key(name) {
+            Ok(self.chans.get_mut(name).unwrap())
         } else {
             Err(format!(
                 "AO device {} does not have a channel {name} registered. Registered channels are: {:?}",
@@ -753,9 +753,9 @@ impl DODev {
         Ok(())
     }
 
-    pub fn borrow_chan(&self, name: String) -> Result<&DOChan, String> {
-        if self.chans.keys().contains(&name) {
-            Ok(self.chans.get(&name).unwrap())
+    pub fn borrow_chan(&self, name: &str) -> Result<&DOChan, String> {
+        if self.chans.contains_key(name) {
+            Ok(self.chans.get(name).unwrap())
         } else {
             Err(format!(
                 "DO device {} does not have a channel {name} registered. Registered channels are: {:?}",
@@ -764,9 +764,9 @@ impl DODev {
         }
     }
 
-    pub fn borrow_chan_mut(&mut self, name: String) -> Result<&mut DOChan, String> {
-        if self.chans.keys().contains(&name) {
-            Ok(self.chans.get_mut(&name).unwrap())
+    pub fn borrow_chan_mut(&mut self, name: &str) -> Result<&mut DOChan, String> {
+        if self.chans.contains_key(name) {
+            Ok(self.chans.get_mut(name).unwrap())
         } else {
             Err(format!(
                 "DO device {} does not have a channel {name} registered. Registered channels are: {:?}",
@@ -781,8 +781,8 @@ impl DODev {
 
     pub fn set_const_fns_only(&mut self, val: bool) {
         if self.const_fns_only != val {
+            // Also clears the compile cache (including `compiled_ports`)
             self.clear_edit_cache();
-            self.clear_compile_cache();
         }
         self.const_fns_only = val;
     }
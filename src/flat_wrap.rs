@@ -5,11 +5,13 @@
 use pyo3::prelude::*;
 use pyo3::PyResult;
 use pyo3::exceptions::{PyValueError, PyKeyError, PyRuntimeError};
+use numpy::{IntoPyArray, PyArray1};
 
 use nistreamer_base::channel::BaseChan;
 use nistreamer_base::device::BaseDev;
 use nistreamer_base::streamer::BaseStreamer;
 use nistreamer_base::fn_lib_base::{FnBoxF64, FnBoxBool};
+use nistreamer_base::std_fn_lib::Sine;
 
 use crate::channel::{AOChan, DOChan};
 use crate::device::{AODev, DODev, NIDev, CommonHwCfg};
@@ -17,7 +19,15 @@ use crate::streamer::Streamer;
 
 #[pyclass]
 pub struct StreamerWrap {
-    inner: Streamer
+    inner: Streamer,
+    // Edit cache version - incremented by every method that can modify the edit cache.
+    // Together with the `stop_time` argument, it identifies the inputs of the last successful `compile()`
+    // so that repeated calls without any edits in between can skip re-compiling.
+    // IMPORTANT: any new method that mutates the edit cache (adds/clears instructions or
+    // changes anything compilation depends on) must do `self.edit_cache_ver += 1`,
+    // otherwise `compile()` may silently return a stale compile cache.
+    edit_cache_ver: u64,
+    last_compile: Option<(u64, Option<f64>)>,
 }
 
 #[pymethods]
@@ -25,7 +35,9 @@ impl StreamerWrap {
     #[new]
     pub fn new() -> Self {
         Self {
-            inner: Streamer::new()
+            inner: Streamer::new(),
+            edit_cache_ver: 0,
+            last_compile: None,
         }
     }
 
@@ -93,10 +105,19 @@ impl StreamerWrap {
     }
 
     #[pyo3(signature = (stop_time=None))]
-    fn compile(&mut self, stop_time: Option<f64>) -> PyResult<f64> {
-        match self.inner.compile(stop_time) {
-            Ok(total_run_time) => Ok(total_run_time),
-            Err(msg) => Err(PyValueError::new_err(msg)),
+    fn compile(&mut self, py: Python<'_>, stop_time: Option<f64>) -> PyResult<f64> {
+        if self.compile_cache_reusable(stop_time) {
+            return Ok(self.inner.shortest_dev_run_time())
+        }
+        match py.allow_threads(|| self.inner.compile(stop_time)) {
+            Ok(total_run_time) => {
+                self.last_compile = Some((self.edit_cache_ver, stop_time));
+                Ok(total_run_time)
+            },
+            Err(msg) => {
+                self.last_compile = None;
+                Err(PyValueError::new_err(msg))
+            },
         }
     }
 
@@ -108,11 +129,13 @@ impl StreamerWrap {
     }
 
     fn clear_edit_cache(&mut self) {
+        self.edit_cache_ver += 1;
         self.inner.clear_edit_cache()
     }
 
     #[pyo3(signature = (reset_time=None))]
     fn add_reset_instr(&mut self, reset_time: Option<f64>) -> PyResult<()> {
+        self.edit_cache_ver += 1;
         match self.inner.add_reset_instr(reset_time) {
             Ok(()) => Ok(()),
             Err(msg) => Err(PyValueError::new_err(msg))
@@ -121,9 +144,17 @@ impl StreamerWrap {
     // endregion
 
     // region Stream control
-    pub fn init_stream(&mut self) -> PyResult<()> {
-        self.inner
-            .init_stream()
+    // Long-running one-off calls (compilation, stream init/close, signal calculation) release the GIL
+    // so that other Python threads can run in the meantime.
+    // Note: the `PyRef`/`PyRefMut` borrow of `self` is held for the whole call, so while
+    // `compile()`, `init_stream()` or `close_stream()` are running, any call to this object
+    // from another thread fails with "Already mutably borrowed" `RuntimeError`.
+    //
+    // `wait_until_finished()` keeps the GIL on purpose: it is polled repeatedly during streaming,
+    // and progress/stop controls (`reps_written_count()`, `request_stop()`) must stay callable
+    // from other threads in between the polls.
+    pub fn init_stream(&mut self, py: Python<'_>) -> PyResult<()> {
+        py.allow_threads(|| self.inner.init_stream())
             .map_err(|msg| PyValueError::new_err(msg))
     }
 
@@ -152,25 +183,59 @@ impl StreamerWrap {
             .map_err(|msg| PyRuntimeError::new_err(msg))
     }
 
-    pub fn close_stream(&mut self) -> PyResult<()> {
-        self.inner
-            .close_stream()
+    pub fn close_stream(&mut self, py: Python<'_>) -> PyResult<()> {
+        py.allow_threads(|| self.inner.close_stream())
             .map_err(|msg| PyRuntimeError::new_err(msg))
     }
+
+    /// Basic repeating by re-launching: launches `nreps` single-repetition runs one after another,
+    /// waiting for each to finish before the next launch.
+    /// Python signals are checked before every launch and between wait intervals,
+    /// so the loop can be interrupted with `KeyboardInterrupt` between repetitions.
+    ///
+    /// `self` is only borrowed for the duration of each individual `launch()`/`wait_until_finished()` call
+    /// and the GIL is briefly released between the polls, so that other Python threads can run
+    /// and call `request_stop()`/`reps_written_count()` meanwhile (same as with a Python-level loop).
+    /// `nreps <= 0` is a no-op (same as `range(nreps)`).
+    pub fn run_reps(slf: &Bound<'_, Self>, nreps: i64) -> PyResult<()> {
+        let py = slf.py();
+        for _ in 0..nreps {
+            py.check_signals()?;
+            slf.try_borrow_mut()?.launch(1)?;
+            loop {
+                let finished = slf.try_borrow_mut()?.wait_until_finished(1.0)?;
+                if finished {
+                    break
+                }
+                py.allow_threads(|| ());
+                py.check_signals()?;
+            }
+        }
+        Ok(())
+    }
     // endregion
 }
 
+impl StreamerWrap {
+    /// Returns `true` if there were no edits since the last successful `compile()` with the same `stop_time`,
+    /// so the existing compile cache can be reused instead of re-compiling
+    fn compile_cache_reusable(&self, stop_time: Option<f64>) -> bool {
+        self.last_compile == Some((self.edit_cache_ver, stop_time))
+            && self.inner.validate_compile_cache().is_ok()
+    }
+}
+
 // region Device methods
 impl StreamerWrap {
     pub fn borrow_dev(&self, name: &str) -> PyResult<&NIDev> {
-        match self.inner.borrow_dev(name.to_string()) {
+        match self.inner.borrow_dev(name) {
             Ok(dev) => Ok(dev),
             Err(msg) => Err(PyKeyError::new_err(msg))
         }
     }
 
     pub fn borrow_dev_mut(&mut self, name: &str) -> PyResult<&mut NIDev> {
-        match self.inner.borrow_dev_mut(name.to_string()) {
+        match self.inner.borrow_dev_mut(name) {
             Ok(dev) => Ok(dev),
             Err(msg) => Err(PyKeyError::new_err(msg))
         }
@@ -216,6 +281,7 @@ impl StreamerWrap {
     }
 
     pub fn dev_clear_edit_cache(&mut self, name: &str) -> PyResult<()> {
+        self.edit_cache_ver += 1;
         let typed_dev = self.borrow_dev_mut(name)?;
         match typed_dev {
             NIDev::AO(dev) => dev.clear_edit_cache(),
@@ -315,6 +381,8 @@ impl StreamerWrap {
     }
 
     pub fn dodev_set_const_fns_only(&mut self, name: &str, val: bool) -> PyResult<()> {
+        // Switching the mode clears the device edit cache
+        self.edit_cache_ver += 1;
         let typed_dev = self.borrow_dev_mut(name)?;
         match typed_dev {
             NIDev::DO(dev) => dev.set_const_fns_only(val),
@@ -333,7 +401,7 @@ impl StreamerWrap {
 
         if let NIDev::AO(dev) = typed_dev {
             let chan_name = AOChan::name_fmt(chan_idx);
-            match dev.borrow_chan(chan_name) {
+            match dev.borrow_chan(&chan_name) {
                 Ok(chan) => Ok(chan),
                 Err(msg) => Err(PyKeyError::new_err(msg)),
             }
@@ -349,7 +417,7 @@ impl StreamerWrap {
 
         if let NIDev::DO(dev) = typed_dev {
             let chan_name = DOChan::name_fmt(port, line);
-            match dev.borrow_chan(chan_name) {
+            match dev.borrow_chan(&chan_name) {
                 Ok(chan) => Ok(chan),
                 Err(msg) => Err(PyKeyError::new_err(msg)),
             }
@@ -365,7 +433,7 @@ impl StreamerWrap {
 
         if let NIDev::AO(dev) = typed_dev {
             let chan_name = AOChan::name_fmt(chan_idx);
-            match dev.borrow_chan_mut(chan_name) {
+            match dev.borrow_chan_mut(&chan_name) {
                 Ok(chan) => Ok(chan),
                 Err(msg) => Err(PyKeyError::new_err(msg)),
             }
@@ -381,7 +449,7 @@ impl StreamerWrap {
 
         if let NIDev::DO(dev) = typed_dev {
             let chan_name = DOChan::name_fmt(port, line);
-            match dev.borrow_chan_mut(chan_name) {
+            match dev.borrow_chan_mut(&chan_name) {
                 Ok(chan) => Ok(chan),
                 Err(msg) => Err(PyKeyError::new_err(msg)),
             }
@@ -426,7 +494,6 @@ impl StreamerWrap {
     }
 
     pub fn chan_last_instr_end_time(&self, dev_name: &str, chan_name: &str) -> PyResult<Option<f64>> {
-        let chan_name = chan_name.to_string();
         let dev = self.borrow_dev(dev_name)?;
         let res = match dev {
             NIDev::AO(dev) => {
@@ -442,7 +509,7 @@ impl StreamerWrap {
     }
 
     pub fn chan_clear_edit_cache(&mut self, dev_name: &str, chan_name: &str) -> PyResult<()> {
-        let chan_name = chan_name.to_string();
+        self.edit_cache_ver += 1;
         let dev = self.borrow_dev_mut(dev_name)?;
         match dev {
             NIDev::AO(dev) => {
@@ -463,6 +530,7 @@ impl StreamerWrap {
         dev_name: &str, chan_idx: usize,
         func: FnBoxF64, t: f64, dur_spec: Option<(f64, bool)>
     ) -> PyResult<()> {
+        self.edit_cache_ver += 1;
         let chan = self.borrow_ao_chan_mut(dev_name, chan_idx)?;
         let res = chan.add_instr(func.inner, t, dur_spec);
         match res {
@@ -477,6 +545,7 @@ impl StreamerWrap {
         dev_name: &str, port: usize, line: usize,
         func: FnBoxBool, t: f64, dur_spec: Option<(f64, bool)>
     ) -> PyResult<()> {
+        self.edit_cache_ver += 1;
         let chan = self.borrow_do_chan_mut(dev_name, port, line)?;
         let res = chan.add_instr(func.inner, t, dur_spec);
         match res {
@@ -485,30 +554,94 @@ impl StreamerWrap {
         }
     }
 
+    #[pyo3(signature = (dev_name, chan_idx, funcs, ts, dur_specs))]
+    pub fn ao_chan_add_instrs(
+        &mut self,
+        dev_name: &str, chan_idx: usize,
+        funcs: Vec<FnBoxF64>, ts: Vec<f64>, dur_specs: Vec<Option<(f64, bool)>>
+    ) -> PyResult<()> {
+        self.edit_cache_ver += 1;
+        check_instr_batch_lens(funcs.len(), ts.len(), dur_specs.len())?;
+        let chan = self.borrow_ao_chan_mut(dev_name, chan_idx)?;
+        for (idx, ((func, t), dur_spec)) in funcs.into_iter().zip(ts).zip(dur_specs).enumerate() {
+            chan.add_instr(func.inner, t, dur_spec)
+                .map_err(|msg| PyValueError::new_err(format!("Failed to add instruction #{idx}:\n{msg}")))?;
+        }
+        Ok(())
+    }
+
+    #[pyo3(signature = (dev_name, port, line, funcs, ts, dur_specs))]
+    pub fn do_chan_add_instrs(
+        &mut self,
+        dev_name: &str, port: usize, line: usize,
+        funcs: Vec<FnBoxBool>, ts: Vec<f64>, dur_specs: Vec<Option<(f64, bool)>>
+    ) -> PyResult<()> {
+        self.edit_cache_ver += 1;
+        check_instr_batch_lens(funcs.len(), ts.len(), dur_specs.len())?;
+        let chan = self.borrow_do_chan_mut(dev_name, port, line)?;
+        for (idx, ((func, t), dur_spec)) in funcs.into_iter().zip(ts).zip(dur_specs).enumerate() {
+            chan.add_instr(func.inner, t, dur_spec)
+                .map_err(|msg| PyValueError::new_err(format!("Failed to add instruction #{idx}:\n{msg}")))?;
+        }
+        Ok(())
+    }
+
+    /// Batch of sine pulses - the `Sine` function instances are constructed here
+    /// so that no per-pulse Python objects are needed
+    #[pyo3(signature = (dev_name, chan_idx, ts, durs, amps, freqs, phases, offs, keep_val))]
+    pub fn ao_chan_add_sines(
+        &mut self,
+        dev_name: &str, chan_idx: usize,
+        ts: Vec<f64>, durs: Vec<f64>,
+        amps: Vec<f64>, freqs: Vec<f64>, phases: Vec<f64>, offs: Vec<f64>,
+        keep_val: bool
+    ) -> PyResult<()> {
+        self.edit_cache_ver += 1;
+        let n = ts.len();
+        if [durs.len(), amps.len(), freqs.len(), phases.len(), offs.len()].iter().any(|&len| len != n) {
+            return Err(PyValueError::new_err(format!(
+                "Sine batch arguments have different lengths: \
+                ts: {n}, durs: {}, amps: {}, freqs: {}, phases: {}, offs: {}",
+                durs.len(), amps.len(), freqs.len(), phases.len(), offs.len()
+            )))
+        }
+        let chan = self.borrow_ao_chan_mut(dev_name, chan_idx)?;
+        for idx in 0..n {
+            let func = Sine::new(amps[idx], freqs[idx], phases[idx], offs[idx]);
+            chan.add_instr(Box::new(func), ts[idx], Some((durs[idx], keep_val)))
+                .map_err(|msg| PyValueError::new_err(format!("Failed to add instruction #{idx}:\n{msg}")))?;
+        }
+        Ok(())
+    }
+
     #[pyo3(signature = (dev_name, chan_idx, n_samps, start_time=None, end_time=None))]
-    pub fn ao_chan_calc_nsamps(
+    pub fn ao_chan_calc_nsamps<'py>(
         &self,
+        py: Python<'py>,
         dev_name: &str, chan_idx: usize,
         n_samps: usize, start_time: Option<f64>, end_time: Option<f64>,
-    ) -> PyResult<Vec<f64>> {
+    ) -> PyResult<Bound<'py, PyArray1<f64>>> {
         let chan = self.borrow_ao_chan(dev_name, chan_idx)?;
-        let res = chan.calc_nsamps(n_samps, start_time, end_time);
+        let res = py.allow_threads(|| chan.calc_nsamps(n_samps, start_time, end_time));
         match res {
-            Ok(samp_vec) => Ok(samp_vec),
+            // Hand the sample vector over to NumPy without copying
+            Ok(samp_vec) => Ok(samp_vec.into_pyarray_bound(py)),
             Err(msg) => Err(PyValueError::new_err(msg))
         }
     }
 
     #[pyo3(signature = (dev_name, port, line, n_samps, start_time=None, end_time=None))]
-    pub fn do_chan_calc_nsamps(
+    pub fn do_chan_calc_nsamps<'py>(
         &self,
+        py: Python<'py>,
         dev_name: &str, port: usize, line: usize,
         n_samps: usize, start_time: Option<f64>, end_time: Option<f64>
-    ) -> PyResult<Vec<bool>> {
+    ) -> PyResult<Bound<'py, PyArray1<bool>>> {
         let chan = self.borrow_do_chan(dev_name, port, line)?;
-        let res = chan.calc_nsamps(n_samps, start_time, end_time);
+        let res = py.allow_threads(|| chan.calc_nsamps(n_samps, start_time, end_time));
         match res {
-            Ok(samp_vec) => Ok(samp_vec),
+            // Hand the sample vector over to NumPy without copying
+            Ok(samp_vec) => Ok(samp_vec.into_pyarray_bound(py)),
             Err(msg) => Err(PyValueError::new_err(msg))
         }
     }
@@ -529,4 +662,188 @@ impl StreamerWrap {
         }
     }
 }
-// endregion
\ No newline at end of file
+// endregion
+
+/// Helper for batch instruction methods - all per-instruction argument vectors must have the same length
+fn check_instr_batch_lens(funcs_len: usize, ts_len: usize, dur_specs_len: usize) -> PyResult<()> {
+    if funcs_len == ts_len && ts_len == dur_specs_len {
+        Ok(())
+    } else {
+        Err(PyValueError::new_err(format!(
+            "Instruction batch arguments have different lengths: \
+            {funcs_len} functions, {ts_len} start times, and {dur_specs_len} duration specs"
+        )))
+    }
+}
+
+#[cfg(test)]
+mod test {
+    use std::f64::consts::PI;
+    use pyo3::prelude::*;
+    use nistreamer_base::fn_lib_base::{FnBoxF64, FnBoxBool};
+    use nistreamer_base::std_fn_lib::{ConstF64, ConstBool};
+    use crate::flat_wrap::*;
+
+    fn const_f64(val: f64) -> FnBoxF64 {
+        FnBoxF64 { inner: Box::new(ConstF64::new(val)) }
+    }
+
+    fn const_bool(val: bool) -> FnBoxBool {
+        FnBoxBool { inner: Box::new(ConstBool::new(val)) }
+    }
+
+    fn new_streamer() -> StreamerWrap {
+        let mut strmr = StreamerWrap::new();
+        strmr.add_ao_dev("Dev1", 1e6).unwrap();
+        strmr.add_ao_chan("Dev1", 0, 0.0, 0.0).unwrap();
+        strmr.add_do_dev("Dev2", 1e6).unwrap();
+        strmr.add_do_chan("Dev2", 0, 0, false, false).unwrap();
+        strmr.ao_chan_add_instr("Dev1", 0, const_f64(1.0), 0.0, Some((1.0, false))).unwrap();
+        strmr.do_chan_add_instr("Dev2", 0, 0, const_bool(true), 0.0, Some((1.0, false))).unwrap();
+        strmr
+    }
+
+    #[test]
+    fn compile_skip() {
+        pyo3::prepare_freethreaded_python();
+        Python::with_gil(|py| {
+            let mut strmr = new_streamer();
+
+            // Never compiled
+            assert!(!strmr.compile_cache_reusable(None));
+            strmr.compile(py, None).unwrap();
+
+            // No edits since the last compile - skipped
+            assert!(strmr.compile_cache_reusable(None));
+            strmr.compile(py, None).unwrap();
+            assert!(strmr.compile_cache_reusable(None));
+
+            // Different `stop_time` - recompiles
+            assert!(!strmr.compile_cache_reusable(Some(2.0)));
+            strmr.compile(py, Some(2.0)).unwrap();
+            assert!(strmr.compile_cache_reusable(Some(2.0)));
+            assert!(!strmr.compile_cache_reusable(None));
+
+            // New instruction - recompiles
+            strmr.ao_chan_add_instr("Dev1", 0, const_f64(2.0), 1.5, Some((0.1, false))).unwrap();
+            assert!(!strmr.compile_cache_reusable(Some(2.0)));
+            strmr.compile(py, Some(2.0)).unwrap();
+            assert!(strmr.compile_cache_reusable(Some(2.0)));
+
+            // Batch instructions - recompiles
+            strmr.do_chan_add_instrs("Dev2", 0, 0, vec![const_bool(true)], vec![1.5], vec![Some((0.1, false))]).unwrap();
+            assert!(!strmr.compile_cache_reusable(Some(2.0)));
+            strmr.compile(py, Some(2.0)).unwrap();
+
+            // Clearing a channel - recompiles
+            strmr.chan_clear_edit_cache("Dev1", "ao0").unwrap();
+            assert!(!strmr.compile_cache_reusable(Some(2.0)));
+            strmr.compile(py, Some(2.0)).unwrap();
+            assert!(strmr.compile_cache_reusable(Some(2.0)));
+
+            // Toggling `const_fns_only` - recompiles
+            let const_fns_only = strmr.dodev_get_const_fns_only("Dev2").unwrap();
+            strmr.dodev_set_const_fns_only("Dev2", !const_fns_only).unwrap();
+            assert!(!strmr.compile_cache_reusable(Some(2.0)));
+        });
+    }
+
+    #[test]
+    fn ao_chan_add_sines() {
+        pyo3::prepare_freethreaded_python();
+        Python::with_gil(|_py| {
+            let mut strmr = new_streamer();
+            strmr.add_ao_chan("Dev1", 1, 0.0, 0.0).unwrap();
+
+            let ts = vec![0.1, 0.3];
+            let durs = vec![0.1, 0.1];
+            let amps = vec![1.0, 2.0];
+            let freqs = vec![10.0, 25.0];
+            let phases = vec![0.5, -1.0];
+            let offs = vec![0.25, -0.5];
+            strmr.ao_chan_add_sines(
+                "Dev1", 1,
+                ts.clone(), durs.clone(), amps.clone(), freqs.clone(), phases.clone(), offs.clone(),
+                false
+            ).unwrap();
+
+            // Values inside each pulse
+            for idx in 0..ts.len() {
+                // `eval_point()` evaluates on the sample clock grid
+                let t = ((ts[idx] + 0.0123) * 1e6).round() / 1e6;
+                let expected = amps[idx] * f64::sin(2.0*PI * freqs[idx] * t + phases[idx]) + offs[idx];
+                let val = strmr.ao_chan_eval_point("Dev1", 1, t).unwrap();
+                assert!((val - expected).abs() < 1e-9, "pulse #{idx}: val = {val}, expected = {expected}");
+            }
+            // Default value in between the pulses (`keep_val = false`)
+            assert_eq!(strmr.ao_chan_eval_point("Dev1", 1, 0.25).unwrap(), 0.0);
+
+            // Mismatched lengths - error and nothing added
+            let last_end = strmr.chan_last_instr_end_time("Dev1", "ao1").unwrap();
+            let res = strmr.ao_chan_add_sines(
+                "Dev1", 1,
+                vec![0.5, 0.7], vec![0.1, 0.1], vec![1.0], vec![10.0, 10.0], vec![0.0, 0.0], vec![0.0, 0.0],
+                false
+            );
+            assert!(res.is_err());
+            assert_eq!(strmr.chan_last_instr_end_time("Dev1", "ao1").unwrap(), last_end);
+        });
+    }
+
+    #[test]
+    fn chan_add_instrs() {
+        pyo3::prepare_freethreaded_python();
+        Python::with_gil(|py| {
+            let mut strmr = new_streamer();
+            strmr.add_ao_chan("Dev1", 1, 0.0, 0.0).unwrap();
+
+            // Successful batch
+            strmr.ao_chan_add_instrs(
+                "Dev1", 1,
+                vec![const_f64(1.0), const_f64(2.0), const_f64(3.0)],
+                vec![0.1, 0.3, 0.5],
+                vec![Some((0.1, false)), Some((0.1, false)), Some((0.1, false))]
+            ).unwrap();
+            assert_eq!(strmr.ao_chan_eval_point("Dev1", 1, 0.15).unwrap(), 1.0);
+            assert_eq!(strmr.ao_chan_eval_point("Dev1", 1, 0.35).unwrap(), 2.0);
+            assert_eq!(strmr.ao_chan_eval_point("Dev1", 1, 0.55).unwrap(), 3.0);
+            assert_eq!(strmr.ao_chan_eval_point("Dev1", 1, 0.25).unwrap(), 0.0);
+
+            strmr.do_chan_add_instrs(
+                "Dev2", 0, 0,
+                vec![const_bool(true), const_bool(true)],
+                vec![1.5, 1.7],
+                vec![Some((0.1, false)), Some((0.1, false))]
+            ).unwrap();
+            assert_eq!(strmr.do_chan_eval_point("Dev2", 0, 0, 1.55).unwrap(), true);
+            assert_eq!(strmr.do_chan_eval_point("Dev2", 0, 0, 1.65).unwrap(), false);
+            assert_eq!(strmr.do_chan_eval_point("Dev2", 0, 0, 1.75).unwrap(), true);
+
+            // Mismatched lengths - error and nothing added
+            let last_end = strmr.chan_last_instr_end_time("Dev1", "ao1").unwrap();
+            let res = strmr.ao_chan_add_instrs(
+                "Dev1", 1,
+                vec![const_f64(1.0), const_f64(2.0)],
+                vec![1.0],
+                vec![Some((0.1, false)), Some((0.1, false))]
+            );
+            assert!(res.is_err());
+            assert_eq!(strmr.chan_last_instr_end_time("Dev1", "ao1").unwrap(), last_end);
+
+            // Instruction #2 collides with the existing one at 0.5..0.6 -
+            // instructions #0 and #1 remain added, #3 is not added
+            let err = strmr.ao_chan_add_instrs(
+                "Dev1", 1,
+                vec![const_f64(4.0), const_f64(5.0), const_f64(6.0), const_f64(7.0)],
+                vec![0.7, 0.9, 0.55, 1.1],
+                vec![Some((0.1, false)), Some((0.1, false)), Some((0.1, false)), Some((0.1, false))]
+            ).unwrap_err();
+            let err_msg = err.value_bound(py).to_string();
+            assert!(err_msg.contains("Failed to add instruction #2"), "{err_msg}");
+            assert_eq!(strmr.ao_chan_eval_point("Dev1", 1, 0.75).unwrap(), 4.0);
+            assert_eq!(strmr.ao_chan_eval_point("Dev1", 1, 0.95).unwrap(), 5.0);
+            assert_eq!(strmr.ao_chan_eval_point("Dev1", 1, 0.55).unwrap(), 3.0);
+            assert_eq!(strmr.ao_chan_eval_point("Dev1", 1, 1.15).unwrap(), 0.0);
+        });
+    }
+}
@@ -53,7 +53,6 @@ use std::time::Duration;
 use std::collections::HashMap;
 
 use parking_lot::Mutex;
-use itertools::Itertools;
 use indexmap::IndexMap;
 
 use nistreamer_base::device::BaseDev;
@@ -236,9 +235,9 @@ impl Streamer {
         self.devs.keys().map(|name| name.clone()).collect()
     }
 
-    pub fn borrow_dev(&self, name: String) -> Result<&NIDev, String> {
-        if self.devs.keys().contains(&name) {
-            Ok(self.devs.get(&name).unwrap())
+    pub fn borrow_dev(&self, name: &str) -> Result<&NIDev, String> {
+        if self.devs.contains_key(name) {
+            Ok(self.devs.get(name).unwrap())
         } else {
             Err(format!(
                 "There is no device with name {name} registered. Registered devices are: {:?}",
@@ -247,9 +246,9 @@ impl Streamer {
         }
     }
 
-    pub fn borrow_dev_mut(&mut self, name: String) -> Result<&mut NIDev, String> {
-        if self.devs.keys().contains(&name) {
-            Ok(self.devs.get_mut(&name).unwrap())
+    pub fn borrow_dev_mut(&mut self, name: &str) -> Result<&mut NIDev, String> {
+        if self.devs.contains_key(name) {
+            Ok(self.devs.get_mut(name).unwrap())
         } else {
             Err(format!(
                 "There is no device with name {name} registered. Registered devices are: {:?}",